@@ -1 +1 @@
-from .trackers import RobotTracker
+from .trackers import DIRECTIONS, RobotTracker
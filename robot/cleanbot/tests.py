@@ -50,6 +50,15 @@ COMMANDS = [
         1,
         id='empty'
     ),
+    pytest.param(
+        [
+            {'direction': 'east', 'steps': 2},
+            {'direction': 'north', 'steps': 0},
+            {'direction': 'west', 'steps': 4},
+        ],
+        5,
+        id='zero_steps'
+    ),
     pytest.param(
         [
             {'direction': 'north', 'steps': 5},
@@ -121,6 +130,62 @@ COMMANDS = [
         8,
         id='tight_snake'
     ),
+    pytest.param(
+        [
+            {'direction': 'east', 'steps': 4},
+            {'direction': 'north', 'steps': 1},
+            {'direction': 'west', 'steps': 2},
+            {'direction': 'south', 'steps': 1},
+            {'direction': 'east', 'steps': 1},
+        ],
+        8,
+        id='contained_range'
+    ),
+    pytest.param(
+        [
+            {'direction': 'east', 'steps': 1},
+            {'direction': 'north', 'steps': 1},
+            {'direction': 'east', 'steps': 2},
+            {'direction': 'south', 'steps': 1},
+            {'direction': 'east', 'steps': 1},
+            {'direction': 'north', 'steps': 1},
+            {'direction': 'east', 'steps': 2},
+            {'direction': 'south', 'steps': 1},
+            {'direction': 'east', 'steps': 1},
+            {'direction': 'west', 'steps': 10},
+        ],
+        17,
+        id='spanning_range'
+    ),
+    pytest.param(
+        [
+            {'direction': 'east', 'steps': 4},
+            {'direction': 'north', 'steps': 1},
+            {'direction': 'west', 'steps': 4},
+            {'direction': 'north', 'steps': 1},
+        ] * 3 + [
+            {'direction': 'south', 'steps': 6},
+        ] + [
+            {'direction': 'north', 'steps': 6},
+            {'direction': 'east', 'steps': 1},
+            {'direction': 'south', 'steps': 6},
+            {'direction': 'east', 'steps': 1},
+        ] * 2,
+        34,
+        id='grid'
+    ),
+]
+
+
+# The naive tracker visits every single vertex, so the huge problems are
+# left out for it
+SMALL_COMMANDS = [
+    param for param in COMMANDS if not param.id.startswith('huge_')
+]
+
+INVALID_COMMANDS = [
+    {'direction': 'north', 'steps': 1},
+    {'direction': 'up', 'steps': 1},
 ]
 
 
@@ -140,6 +205,11 @@ class TestRobotTracker:
         result = RobotTracker().get_num_of_cleaned_vertices(commands)
         assert result == expected
 
+    def test_invalid_direction_raises_error(self):
+        """A command with an unknown direction raises a ValueError."""
+        with pytest.raises(ValueError):
+            RobotTracker.get_num_of_cleaned_vertices(INVALID_COMMANDS)
+
     @pytest.mark.skip
     def test_performance_for_large_problem(self):
         """The performance of the robot tracker is measured for a
@@ -158,3 +228,25 @@ class TestRobotTracker:
         result = RobotTracker().get_num_of_cleaned_vertices(commands)
         elapsed_time = timeit.default_timer() - start_time
         print(f'Unique vertices: {result}\nElapsed time: {elapsed_time}')
+
+
+class TestSimpleRobotTracker:
+    @pytest.mark.parametrize(
+        'commands, expected',
+        SMALL_COMMANDS
+    )
+    def test_num_of_vertices_visited_is_calculated_correctly(
+            self,
+            commands,
+            expected
+    ):
+        """The number of vertices visited by the robot is calculated correctly
+        by the naive implementation.
+        """
+        result = SimpleRobotTracker.get_num_of_cleaned_vertices(commands)
+        assert result == expected
+
+    def test_invalid_direction_raises_error(self):
+        """A command with an unknown direction raises a ValueError."""
+        with pytest.raises(ValueError):
+            SimpleRobotTracker.get_num_of_cleaned_vertices(INVALID_COMMANDS)
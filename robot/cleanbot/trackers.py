@@ -2,14 +2,44 @@
 Tracker and utility classes for robot cleaning jobs.
 """
 import bisect
+from array import array
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Tuple
+
+
+# Unit (dx, dy) displacement for each direction the robot can move in
+_DELTA = {
+    'north': (0, 1),
+    'south': (0, -1),
+    'east': (1, 0),
+    'west': (-1, 0),
+}
+
+# Names of all directions the robot can move in
+DIRECTIONS = tuple(_DELTA)
+
+# Axis ('x' or 'y') and sign of the movement for each direction
+_AXIS_SIGN = {
+    direction: ('x' if dx else 'y', dx + dy)
+    for direction, (dx, dy) in _DELTA.items()
+}
+
+
+def _get_delta(direction: str) -> Tuple[int, int]:
+    """Return the unit (dx, dy) displacement for the given direction."""
+    try:
+        return _DELTA[direction]
+    except KeyError:
+        raise ValueError(f'Invalid direction: {direction}') from None
 
 
 @dataclass
 class Position:
     """Represents a position on a vertex in the 2D office grid."""
+
+    __slots__ = ('x', 'y')
+
     x: int
     y: int
 
@@ -17,187 +47,62 @@ class Position:
         """Update the position based on the given direction
         and number of steps.
         """
-        if direction == 'north':
-            self.y += steps
-        elif direction == 'south':
-            self.y -= steps
-        elif direction == 'east':
-            self.x += steps
-        elif direction == 'west':
-            self.x -= steps
-        else:
-            raise ValueError(f'Invalid direction: {direction}')
-
-
-class CleanedRange:
-    """Represents a range of x-coordinates within a row or y-coordinates
-    within a column. Between the start and end coordinates (inclusive),
-    all vertices are cleaned.
-    """
-
-    def __init__(self, start: int, end: Optional[int] = None):
-        self.start = start
-        self.end = start if end is None else end
-
-    def __lt__(self, other) -> bool:
-        """Make two ranges (lexicographically) comparable."""
-        return (self.start, self.end) < (other.start, other.end)
-
-    def __len__(self) -> int:
-        """Return the total number of vertices within the range."""
-        return self.end - self.start + 1
-
-    def overlaps_with(self, other) -> bool:
-        """Return True if this range overlaps with the other range.
-
-        A direct adjacency (e.g., self ends at 4, other starts at 5)
-        is also considered an overlap.
-        """
-        return (self.start <= other.start <= self.end + 1) \
-            or (self.start - 1 <= other.end <= self.end)
-
-    def merge_with(self, other) -> None:
-        """Merge this range with the other range."""
-        self.start = min(self.start, other.start)
-        self.end = max(self.end, other.end)
+        dx, dy = _get_delta(direction)
+        self.x += dx * steps
+        self.y += dy * steps
 
 
 class Line:
-    """Represents a row or column in a 2D grid."""
+    """Represents a row or column in a 2D grid.
 
-    def __init__(self):
-        self.c_ranges = []
-
-    def __contains__(self, item) -> bool:
-        """Return True if the given item is in any of the line's
-        self.c_ranges.
-
-        Takes advantage of the fact that self.c_ranges is sorted.
-        """
-        for c_range in self.c_ranges:
-            if c_range.start <= item <= c_range.end:
-                return True
-            if c_range.start > item:
-                return False
-        return False
-
-    @property
-    def cleaned_coords(self) -> List[int]:
-        """Return a list of the coordinates of all cleaned vertices
-        within the line.
-
-        If the line represents a row, the coordinates are the x-coordinates.
-        If the line represents a column, the coordinates are the y-coordinates.
-        """
-        return [
-            coord
-            for c_range in self.c_ranges
-            for coord in range(c_range.start, c_range.end + 1)
-        ]
-
-    def insert(self, new_range: CleanedRange) -> None:
-        """Update the line's cleaned ranges.
-
-        If the given range overlaps with an existing range, the existing range
-        is extended to include the new range. Otherwise, the new range is
-        added to the line.
-        """
-        # Find index for new_range to be inserted such that
-        # self.cleaned_ranges remains sorted
-        index = bisect.bisect_left(self.c_ranges, new_range)
-
-        # If the given range overlaps with an existing range, extend the
-        # existing range to include the new range.
-        is_left_merged = is_right_merged = False
-        if index > 0:
-            next_lower = self.c_ranges[index - 1]
-            if new_range.overlaps_with(next_lower):
-                next_lower.merge_with(new_range)
-                is_left_merged = True
-
-        if index < len(self.c_ranges):
-            next_higher = self.c_ranges[index]
-            if new_range.overlaps_with(next_higher):
-                next_higher.merge_with(new_range)
-                is_right_merged = True
-
-        if is_right_merged and is_left_merged:
-            self._merge_existing_ranges(index, next_higher, next_lower)
-
-        elif not is_right_merged and not is_left_merged:
-            self.c_ranges.insert(index, new_range)
-
-    def get_num_of_cleaned_vertices(self) -> int:
-        """Return the number of vertices in the line that have been cleaned."""
-        return sum(len(c_range) for c_range in self.c_ranges)
-
-    def _merge_existing_ranges(self, index, next_higher, next_lower) -> None:
-        """Merge two existing ranges and delete the larger one to prevent
-        redundancies.
-        """
-        next_lower.merge_with(next_higher)
-        self.c_ranges.pop(index)
-
-
-class Office:
-    """Represents the office space as a 2D grid of vertices through which
-    the robot can be moved.
+    The cleaned ranges are stored as two parallel arrays of machine ints
+    (structure of arrays): self.starts[i] and self.ends[i] hold the
+    (inclusive) bounds of the i-th range. The ranges are kept sorted and
+    disjoint, with no two ranges being directly adjacent.
     """
 
-    def __init__(self):
-        """
-        self.robot_position: the robot's current position within the 2D grid,
-            initialized (w.l.o.g.) to the origin.
-        self.rows: a dictionary with each key being the y coordinate of the
-            row and its value being a Line instance
-        self.cols: a dictionary with each key being the x coordinate of the
-            col and its value being a Line instance
-        """
-        self.robot_position = Position(0, 0)
-        self.rows = defaultdict(Line)
-        self.cols = defaultdict(Line)
-
-        # Add starting position
-        self.rows[0].insert(CleanedRange(0))
-        self.cols[0].insert(CleanedRange(0))
+    __slots__ = ('starts', 'ends')
 
-    def move_robot(self, direction: str, steps: int) -> None:
-        """Move the robot in the specified direction and number of steps.
+    def __init__(self):
+        self.starts = array('q')
+        self.ends = array('q')
 
-        Update the robot's position and record the cleaned vertices.
-        """
-        self._add_range_to_line(direction, steps)
-        self.robot_position.update(direction, steps)
+    @classmethod
+    def from_segments(cls, segments: List[Tuple[int, int]]) -> 'Line':
+        """Build a line from (start, end) segments in any order.
 
-    def _add_range_to_line(self, direction: str, steps: int) -> None:
-        """Calculate a CleanedRange instance based on the direction and
-        add it to the appropriate line.
+        The segments are sorted once and unioned in a single linear sweep.
+        Note that the given list is sorted in place.
         """
-        c_range = self._get_range_for(direction, steps)
+        line = cls()
+        if not segments:
+            return line
+
+        segments.sort()
+        starts, ends = line.starts, line.ends
+        cur_start, cur_end = segments[0]
+        for start, end in segments:
+            if start <= cur_end + 1:
+                if end > cur_end:
+                    cur_end = end
+            else:
+                starts.append(cur_start)
+                ends.append(cur_end)
+                cur_start, cur_end = start, end
 
-        if direction in ['east', 'west']:
-            self.rows[self.robot_position.y].insert(c_range)
-        else:
-            self.cols[self.robot_position.x].insert(c_range)
+        starts.append(cur_start)
+        ends.append(cur_end)
+        return line
 
-    def _get_range_for(self, direction: str, steps: int) -> CleanedRange:
-        """Calculate a CleanedRange instance based on the direction and
-        number of steps.
+    def iter_ranges(self) -> Iterator[Tuple[int, int]]:
+        """Iterate over the (start, end) bounds of the line's cleaned
+        ranges in ascending order.
         """
-        if direction == 'east':
-            start = self.robot_position.x
-            end = self.robot_position.x + steps
-        elif direction == 'west':
-            start = self.robot_position.x - steps
-            end = self.robot_position.x
-        elif direction == 'north':
-            start = self.robot_position.y
-            end = self.robot_position.y + steps
-        else:
-            start = self.robot_position.y - steps
-            end = self.robot_position.y
-
-        return CleanedRange(start, end)
+        return zip(self.starts, self.ends)
+
+    def get_num_of_cleaned_vertices(self) -> int:
+        """Return the number of vertices in the line that have been cleaned."""
+        return sum(self.ends) - sum(self.starts) + len(self.starts)
 
 
 class RobotTracker:
@@ -205,48 +110,161 @@ class RobotTracker:
     of vertices cleaned.
     """
 
-    def __init__(self):
-        self.office = Office()
-
-    def get_num_of_cleaned_vertices(self, commands: List[Dict]) -> int:
+    @staticmethod
+    def get_num_of_cleaned_vertices(commands: List[Dict]) -> int:
         """Calculate the number of unique vertices cleaned by the robot.
 
+        All segments swept by the robot are collected first. Each row and
+        column is then built in one sort and sweep, and the vertices
+        recorded in both a row and a column are subtracted once at the end.
+
         Args:
           - commands: a list of commands to be executed, with each command
             specifying the direction to move in and the number of steps.
         """
-        for command in commands:
-            self.office.move_robot(
-                direction=command['direction'],
-                steps=command['steps']
-            )
+        row_segments = defaultdict(list)
+        col_segments = defaultdict(list)
 
-        return self._row_total + self._col_total
+        # The starting position is cleaned even if the robot never moves
+        row_segments[0].append((0, 0))
 
-    @property
-    def _row_total(self) -> int:
-        """Calculate the total number of cleaned vertices recorded in the
-        office's rows."""
-        return sum(
-            row.get_num_of_cleaned_vertices()
-            for row in self.office.rows.values()
+        x = y = 0
+        for axis, min_offset, max_offset, offset in _fuse_commands(commands):
+            if axis == 'x':
+                row_segments[y].append((x + min_offset, x + max_offset))
+                x += offset
+            else:
+                col_segments[x].append((y + min_offset, y + max_offset))
+                y += offset
+
+        rows = {y: Line.from_segments(s) for y, s in row_segments.items()}
+        cols = {x: Line.from_segments(s) for x, s in col_segments.items()}
+
+        row_total = sum(
+            row.get_num_of_cleaned_vertices() for row in rows.values()
         )
+        return row_total + RobotTracker._count_unique_col_vertices(rows, cols)
 
-    @property
-    def _col_total(self) -> int:
-        """Calculate the total number of cleaned vertices recorded in the
-        office's columns, minus the ones that are also recorded in the
-        office's rows.
+    @staticmethod
+    def _count_unique_col_vertices(
+            rows: Dict[int, Line],
+            cols: Dict[int, Line]
+    ) -> int:
+        """Count the cleaned vertices in the columns that are not recorded
+        in the row they lie on.
+
+        The columns are visited in a single sweep over x. A row range is
+        activated at its start and deactivated after its end, so that the
+        rows crossing a column range are exactly the active rows between
+        its bounds, which are counted with a Fenwick tree over the row
+        coordinates. This takes O(n log n) time for n ranges, no matter how
+        many rows each column crosses.
         """
-        return sum(
-            self._unique_vertices_in_column(col, x)
-            for x, col in self.office.cols.items()
-        )
+        row_ys = sorted(rows)
+        row_indices = {y: i for i, y in enumerate(row_ys)}
+
+        # (x, row index, +1 or -1) whenever a row range starts or ends
+        events = []
+        for y, row in rows.items():
+            index = row_indices[y]
+            for start, end in row.iter_ranges():
+                events.append((start, index, 1))
+                events.append((end + 1, index, -1))
+        events.sort()
+
+        active_rows = _FenwickTree(len(row_ys))
+        bisect_left, bisect_right = bisect.bisect_left, bisect.bisect_right
+        num_events = len(events)
+        next_event = 0
+
+        num_unique = 0
+        for x in sorted(cols):
+            while next_event < num_events and events[next_event][0] <= x:
+                _, index, delta = events[next_event]
+                active_rows.add(index, delta)
+                next_event += 1
+
+            col = cols[x]
+            num_unique += col.get_num_of_cleaned_vertices()
+            for start, end in col.iter_ranges():
+                lo = bisect_left(row_ys, start)
+                hi = bisect_right(row_ys, end)
+                if lo < hi:
+                    num_unique -= active_rows.prefix_sum(hi) \
+                        - active_rows.prefix_sum(lo)
+
+        return num_unique
+
+
+class _FenwickTree:
+    """Fenwick (binary indexed) tree over a fixed number of integer counts,
+    supporting point updates and prefix sums in O(log n) time.
+    """
 
-    def _unique_vertices_in_column(self, col: Line, x: int) -> int:
-        return sum(
-            1 for y in col.cleaned_coords if x not in self.office.rows[y]
-        )
+    __slots__ = ('tree',)
+
+    def __init__(self, size: int):
+        self.tree = [0] * (size + 1)
+
+    def add(self, index: int, delta: int) -> None:
+        """Add delta to the count at the given (0-based) index."""
+        tree = self.tree
+        size = len(tree)
+        index += 1
+        while index < size:
+            tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, stop: int) -> int:
+        """Return the sum of the counts at the indices below stop."""
+        tree = self.tree
+        total = 0
+        while stop:
+            total += tree[stop]
+            stop &= stop - 1
+        return total
+
+
+def _fuse_commands(
+        commands: List[Dict]
+) -> Iterator[Tuple[str, int, int, int]]:
+    """Fuse runs of consecutive commands along the same axis, ignoring
+    commands with zero steps.
+
+    Yield an (axis, min_offset, max_offset, offset) tuple for each run,
+    where the offsets are relative to the robot's position at the start
+    of the run: min_offset and max_offset bound the vertices visited
+    during the run, and offset is the robot's net displacement.
+    """
+    axis = None
+    min_offset = max_offset = offset = 0
+
+    for command in commands:
+        direction, steps = command['direction'], command['steps']
+        try:
+            command_axis, sign = _AXIS_SIGN[direction]
+        except KeyError:
+            raise ValueError(f'Invalid direction: {direction}') from None
+
+        if not steps:
+            # The robot stays on its (already cleaned) vertex. Skipping the
+            # command also keeps the runs on either side of it fused.
+            continue
+
+        if command_axis != axis:
+            if axis is not None:
+                yield axis, min_offset, max_offset, offset
+            axis = command_axis
+            min_offset = max_offset = offset = 0
+
+        offset += sign * steps
+        if offset < min_offset:
+            min_offset = offset
+        elif offset > max_offset:
+            max_offset = offset
+
+    if axis is not None:
+        yield axis, min_offset, max_offset, offset
 
 
 class SimpleRobotTracker:
@@ -269,28 +287,12 @@ class SimpleRobotTracker:
         for command in commands:
             direction, steps = command['direction'], command['steps']
 
-            if direction == 'east':
-                places = {
-                    (robot_pos.x + i, robot_pos.y)
-                    for i in range(1, steps + 1)
-                }
-            elif direction == 'west':
-                places = {
-                    (robot_pos.x - i, robot_pos.y)
-                    for i in range(1, steps + 1)
-                }
-            elif direction == 'north':
-                places = {
-                    (robot_pos.x, robot_pos.y + i)
-                    for i in range(1, steps + 1)
-                }
-            else:
-                places = {
-                    (robot_pos.x, robot_pos.y - i)
-                    for i in range(1, steps + 1)
-                }
+            dx, dy = _get_delta(direction)
+            x, y = robot_pos.x, robot_pos.y
+            visited.update(
+                (x + dx * i, y + dy * i) for i in range(1, steps + 1)
+            )
 
-            visited |= places
             robot_pos.update(direction, steps)
 
         return len(visited)
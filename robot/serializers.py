@@ -1,5 +1,7 @@
+from django.conf import settings
 from rest_framework import serializers
 
+from .cleanbot import DIRECTIONS
 from .models import Execution
 
 
@@ -18,3 +20,76 @@ class ExecutionSerializer(serializers.ModelSerializer):
         representation = super().to_representation(instance)
         representation['duration'] = format(representation['duration'], '.6f')
         return representation
+
+
+class PositionSerializer(serializers.Serializer):
+    """Validates the x and y coordinates of a vertex in the office grid."""
+
+    x = serializers.IntegerField()
+    y = serializers.IntegerField()
+
+
+class CommandListField(serializers.Field):
+    """Validates a list of robot commands, each being a dictionary with
+    a direction and a non-negative integer number of steps.
+
+    Jobs can hold many thousands of commands, so they are checked in a
+    single loop rather than by a nested serializer per command. At most
+    settings.ROBOT_MAX_COMMANDS commands of at most settings.ROBOT_MAX_STEPS
+    steps each are accepted.
+    """
+
+    default_error_messages = {
+        'not_a_list': 'Expected a list of commands but got type '
+                      '"{input_type}".',
+        'max_length': 'Ensure there are no more than {max_length} commands.',
+        'invalid': 'Command {index} must have a direction out of '
+                   '{directions} and an integer number of steps between 0 '
+                   'and {max_steps}.',
+    }
+
+    def to_internal_value(self, data):
+        if not isinstance(data, list):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if len(data) > settings.ROBOT_MAX_COMMANDS:
+            self.fail('max_length', max_length=settings.ROBOT_MAX_COMMANDS)
+
+        max_steps = settings.ROBOT_MAX_STEPS
+        for index, command in enumerate(data):
+            try:
+                direction, steps = command['direction'], command['steps']
+            except (TypeError, KeyError):
+                self._fail_invalid(index)
+            if direction not in DIRECTIONS \
+                    or type(steps) is not int or not 0 <= steps <= max_steps:
+                self._fail_invalid(index)
+
+        return data
+
+    def to_representation(self, value):
+        return value
+
+    def _fail_invalid(self, index):
+        self.fail(
+            'invalid',
+            index=index,
+            directions=', '.join(DIRECTIONS),
+            max_steps=settings.ROBOT_MAX_STEPS
+        )
+
+
+class CleaningJobSerializer(serializers.Serializer):
+    """Validates a robot cleaning job submitted to the API."""
+
+    start = PositionSerializer()
+    commands = CommandListField()
+
+    @property
+    def has_too_many_commands(self):
+        """Return True if the job was rejected for holding more commands
+        than allowed.
+        """
+        return any(
+            error.code == 'max_length'
+            for error in self.errors.get('commands', [])
+        )
@@ -3,12 +3,23 @@ End-to-end tests for the cleaning robot API.
 """
 import pytest
 import json
+import time
 
+from django.core.cache import cache
 from django.urls import reverse
 
+from .cleanbot import RobotTracker
 from .models import Execution
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache, so that results cached by
+    other tests cannot decide whether a job is calculated.
+    """
+    cache.clear()
+
+
 @pytest.mark.django_db
 class TestRobotAPI:
     def test_execution_is_created(self, client):
@@ -43,4 +54,189 @@ class TestRobotAPI:
         assert response.status_code == 201
 
         for attr in ['timestamp', 'commands', 'result', 'duration']:
-            assert attr in response.json()
\ No newline at end of file
+            assert attr in response.json()
+
+    def test_execution_data_matches_job(self, client):
+        """The returned and stored execution data describe the submitted
+        cleaning job.
+        """
+        payload = {
+            'start': {'x': 0, 'y': 0},
+            'commands': [
+                {'direction': 'north', 'steps': 2},
+                {'direction': 'east', 'steps': 1}
+            ]
+        }
+        response = client.post(
+            reverse('robot:clean'),
+            data=json.dumps(payload),
+            content_type='application/json'
+        )
+        data = response.json()
+
+        assert data['commands'] == 2
+        assert data['result'] == 4
+        assert Execution.objects.get(id=data['id']).result == 4
+
+    @pytest.mark.parametrize(
+        'payload',
+        [
+            pytest.param(
+                {'commands': [{'direction': 'north', 'steps': 1}]},
+                id='missing_start'
+            ),
+            pytest.param(
+                {'start': {'x': 0, 'y': 0}},
+                id='missing_commands'
+            ),
+            pytest.param(
+                {'start': {'x': 0, 'y': 0}, 'commands': 'north'},
+                id='commands_not_a_list'
+            ),
+            pytest.param(
+                {
+                    'start': {'x': 0, 'y': 0},
+                    'commands': [{'direction': 'up', 'steps': 1}]
+                },
+                id='invalid_direction'
+            ),
+            pytest.param(
+                {
+                    'start': {'x': 0, 'y': 0},
+                    'commands': [{'direction': 'north', 'steps': -1}]
+                },
+                id='negative_steps'
+            ),
+            pytest.param(
+                {
+                    'start': {'x': 0, 'y': 0},
+                    'commands': [{'direction': 'north', 'steps': 10 ** 6}]
+                },
+                id='too_many_steps'
+            ),
+        ]
+    )
+    def test_invalid_job_is_rejected(self, client, payload):
+        """An invalid cleaning job is rejected without creating an
+        execution instance.
+        """
+        num_executions = Execution.objects.count()
+
+        response = client.post(
+            reverse('robot:clean'),
+            data=json.dumps(payload),
+            content_type='application/json'
+        )
+
+        assert response.status_code == 400
+        assert Execution.objects.count() == num_executions
+
+    def test_resubmitted_job_is_not_recomputed(self, client, monkeypatch):
+        """The result of a resubmitted cleaning job is taken from the
+        cache instead of being calculated again, and its execution records
+        the time of the lookup rather than that of the original calculation.
+        """
+        payload = {
+            'start': {'x': 0, 'y': 0},
+            'commands': [
+                {'direction': 'south', 'steps': 3},
+                {'direction': 'west', 'steps': 7}
+            ]
+        }
+
+        def post_job():
+            return client.post(
+                reverse('robot:clean'),
+                data=json.dumps(payload),
+                content_type='application/json'
+            )
+
+        calculate = RobotTracker.get_num_of_cleaned_vertices
+
+        def calculate_slowly(commands):
+            time.sleep(0.05)
+            return calculate(commands)
+
+        monkeypatch.setattr(
+            RobotTracker,
+            'get_num_of_cleaned_vertices',
+            calculate_slowly
+        )
+        first_response = post_job()
+
+        def fail(commands):
+            raise AssertionError('The result was calculated again.')
+
+        monkeypatch.setattr(RobotTracker, 'get_num_of_cleaned_vertices', fail)
+        second_response = post_job()
+
+        assert second_response.status_code == 201
+        assert second_response.json()['result'] \
+            == first_response.json()['result'] == 11
+        assert float(second_response.json()['duration']) \
+            < 0.05 <= float(first_response.json()['duration'])
+
+    def test_malformed_json_is_rejected(self, client):
+        """A request body that is not valid JSON is rejected."""
+        response = client.post(
+            reverse('robot:clean'),
+            data='{"start": {"x": 0, "y": 0}, "commands": [',
+            content_type='application/json'
+        )
+
+        assert response.status_code == 400
+
+    def test_largest_job_is_accepted(self, client, settings):
+        """A cleaning job at the command and step limits is accepted, even
+        when sent as indented JSON, and its result can be stored.
+        """
+        payload = {
+            'start': {'x': 0, 'y': 0},
+            'commands': [
+                {'direction': 'east', 'steps': settings.ROBOT_MAX_STEPS}
+            ] * settings.ROBOT_MAX_COMMANDS
+        }
+        response = client.post(
+            reverse('robot:clean'),
+            data=json.dumps(payload, indent=4),
+            content_type='application/json'
+        )
+
+        assert response.status_code == 201
+        result = response.json()['result']
+        assert result \
+            == settings.ROBOT_MAX_COMMANDS * settings.ROBOT_MAX_STEPS + 1
+        # Largest value of a PositiveIntegerField on all supported databases
+        assert result <= 2 ** 31 - 1
+
+    def test_oversized_job_is_rejected(self, client, settings):
+        """A cleaning job with more commands than allowed is rejected as
+        too large.
+        """
+        settings.ROBOT_MAX_COMMANDS = 2
+        payload = {
+            'start': {'x': 0, 'y': 0},
+            'commands': [{'direction': 'north', 'steps': 1}] * 3
+        }
+        response = client.post(
+            reverse('robot:clean'),
+            data=json.dumps(payload),
+            content_type='application/json'
+        )
+
+        assert response.status_code == 413
+
+    def test_oversized_body_is_rejected(self, client, settings):
+        """A request body larger than allowed is rejected as too large."""
+        settings.ROBOT_MAX_BODY_SIZE = 100
+        payload = {
+            'start': {'x': 0, 'y': 0},
+            'commands': [{'direction': 'north', 'steps': 1}] * 10
+        }
+        response = client.post(
+            reverse('robot:clean'),
+            data=json.dumps(payload),
+            content_type='application/json'
+        )
+
+        assert response.status_code == 413
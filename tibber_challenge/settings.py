@@ -93,6 +93,20 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.0/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'TIMEOUT': 3600,
+        'OPTIONS': {
+            'MAX_ENTRIES': 1024,
+        },
+    }
+}
+
+
 # Django Rest Framework
 
 REST_FRAMEWORK = {
@@ -102,6 +116,24 @@ REST_FRAMEWORK = {
     ),
 }
 
+# Cleaning jobs
+
+# Maximum number of commands accepted in a single cleaning job, and of
+# steps accepted in a single command. A job can clean up to
+# ROBOT_MAX_COMMANDS * ROBOT_MAX_STEPS + 1 vertices, which must fit into
+# Execution.result (a 32-bit integer column on PostgreSQL).
+ROBOT_MAX_COMMANDS = env.int('ROBOT_MAX_COMMANDS', default=10000)
+ROBOT_MAX_STEPS = env.int('ROBOT_MAX_STEPS', default=99999)
+
+# Maximum size of a cleaning job's request body in bytes, enforced by
+# OrjsonParser. The default leaves room for ROBOT_MAX_COMMANDS commands
+# even when the JSON is indented.
+ROBOT_MAX_BODY_SIZE = env.int(
+    'ROBOT_MAX_BODY_SIZE',
+    default=128 * ROBOT_MAX_COMMANDS + 1024
+)
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/4.0/topics/i18n/
 